@@ -6,18 +6,18 @@ from __future__ import annotations
 
 import collections
 import inspect
-from copy import deepcopy
-from functools import cached_property
+from copy import copy, deepcopy
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 import numpy as np
+import ray
 from monty.json import MontyDecoder, MSONable
 from monty.serialization import loadfn
 from numpy.random import normal
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.core.composition import Element
 from pymatgen.entries.computed_entries import ConstantEnergyAdjustment
-from pymatgen.entries.entry_tools import EntrySet
 from tqdm import tqdm
 
 from rxn_network.core import Composition
@@ -29,7 +29,8 @@ from rxn_network.entries.gibbs import GibbsComputedEntry
 from rxn_network.entries.interpolated import InterpolatedEntry
 from rxn_network.entries.nist import NISTReferenceEntry
 from rxn_network.thermo.utils import expand_pd
-from rxn_network.utils.funcs import get_logger
+from rxn_network.utils.funcs import get_logger, limited_powerset
+from rxn_network.utils.ray import initialize_ray, to_iterator
 
 logger = get_logger(__name__)
 
@@ -96,7 +97,7 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
             entry: An entry object.
         """
         self.entries.add(entry)
-        self._clear_cache()
+        self._clear_cache(extend_chemsys_with=[entry])
 
     def update(
         self,
@@ -107,8 +108,9 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         Args:
             entries: Iterable of entry objects to add to the set.
         """
+        entries = list(entries)
         self.entries.update(entries)
-        self._clear_cache()
+        self._clear_cache(extend_chemsys_with=entries)
 
     def discard(self, entry: GibbsComputedEntry | ExperimentalReferenceEntry) -> None:
         """Discard an entry. This is an IN-PLACE method.
@@ -144,14 +146,39 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         if not chem_sys.issubset(self.chemsys):
             raise ValueError(f"{chem_sys} is not a subset of {self.chemsys}")
 
-        subset = set()
-        for e in self.entries:
-            elements = [sp.symbol for sp in e.composition]
-            if chem_sys.issuperset(elements):
-                subset.add(e)
+        entries_by_chemsys = self.entries_by_chemsys
+        if 2 ** len(chem_sys) < len(entries_by_chemsys):
+            keys = (frozenset(c) for c in limited_powerset(chem_sys, len(chem_sys)))
+        else:
+            keys = (k for k in entries_by_chemsys if k <= chem_sys)
+
+        subset = [e for k in keys for e in entries_by_chemsys.get(k, ())]
 
         return GibbsEntrySet(subset, calculate_e_above_hulls=False)
 
+    def get_pd_in_chemsys(self, chemsys: list[str] | str) -> PhaseDiagram:
+        """Returns a PhaseDiagram built from the subset of entries belonging to a
+        particular chemical system (including subsystems). Phase diagrams are cached by
+        chemical system, so repeated calls for the same system do not rebuild the convex
+        hull. The cache is cleared whenever the entry set is modified in place.
+
+        Args:
+            chemsys: Chemical system specified as list of elements. E.g., ["Li", "O"]
+
+        Returns:
+            PhaseDiagram object (pymatgen)
+        """
+        if isinstance(chemsys, str):
+            chemsys = chemsys.split("-")
+
+        key = frozenset(chemsys)
+        pd = self._pd_cache.get(key)
+        if pd is None:
+            pd = PhaseDiagram(self.get_subset_in_chemsys(list(key)))
+            self._pd_cache[key] = pd
+
+        return pd
+
     def filter_by_stability(self, e_above_hull: float, include_polymorphs: bool | None = False) -> GibbsEntrySet:
         """Filter the entry set by a metastability (energy above hull) cutoff.
 
@@ -168,24 +195,36 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         """
         pd_dict = self.pd_dict
 
-        filtered_entries: set[GibbsComputedEntry | NISTReferenceEntry] = set()
-        all_comps: dict[str, GibbsComputedEntry | NISTReferenceEntry] = {}
+        # the same entry objects appear in many sub-PDs; only evaluate each one once
+        hull_cache: dict[int, float] = {}
+        filtered_entries: list[GibbsComputedEntry | NISTReferenceEntry] = []
+        all_comps: dict[str, tuple[float, GibbsComputedEntry | NISTReferenceEntry]] = {}
 
         for pd in pd_dict.values():
             for entry in pd.all_entries:
-                if entry in filtered_entries or pd.get_e_above_hull(entry) > e_above_hull:
+                key = id(entry)
+                if key in hull_cache:
+                    continue
+
+                hull_cache[key] = pd.get_e_above_hull(entry)
+                if hull_cache[key] > e_above_hull:
+                    continue
+
+                if include_polymorphs:
+                    filtered_entries.append(entry)
                     continue
 
                 formula = entry.composition.reduced_formula
-                if not include_polymorphs and (formula in all_comps):
-                    if all_comps[formula].energy_per_atom < entry.energy_per_atom:
-                        continue
-                    filtered_entries.remove(all_comps[formula])
+                energy_per_atom = entry.energy_per_atom
+                if formula in all_comps and all_comps[formula][0] < energy_per_atom:
+                    continue
 
-                all_comps[formula] = entry
-                filtered_entries.add(entry)
+                all_comps[formula] = (energy_per_atom, entry)
 
-        return self.__class__(list(filtered_entries))
+        if not include_polymorphs:
+            filtered_entries = [entry for _, entry in all_comps.values()]
+
+        return self.__class__(filtered_entries)
 
     def build_indices(self) -> None:
         """Builds the indices for the entry set in place. This method is called whenever an
@@ -210,7 +249,7 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         Returns:
             Ground state computed entry object.
         """
-        return self.min_entries_by_formula[Composition(formula).reduced_formula]
+        return self.min_entries_by_formula[_get_reduced_composition(formula).reduced_formula]
 
     def get_stabilized_entry(self, entry: ComputedEntry, tol: float = 1e-3, force=False) -> ComputedEntry:
         """Helper method for lowering the energy of a single entry such that it is just
@@ -285,15 +324,14 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
             A new GibbsEntrySet with entries that have had their energies shifted by
             random Gaussian noise based on their "correction_uncertainty" values.
         """
-        entries = deepcopy(self.entries_list)
-        new_entries = []
-        jitter = normal(size=len(entries))
+        entries = [e for e in self.entries_list if not e.is_element]
+        uncertainties = np.fromiter((e.correction_uncertainty for e in entries), dtype=np.float64, count=len(entries))
+        jitter = normal(size=len(entries)) * uncertainties
 
-        for idx, entry in enumerate(entries):
-            if entry.is_element:
-                continue
+        new_entries = []
+        for entry, value in zip(entries, jitter):
             adj = ConstantEnergyAdjustment(
-                value=jitter[idx] * entry.correction_uncertainty,
+                value=value,
                 name="Random jitter",
                 description=("Randomly sampled (Gaussian) noise to account for uncertainty in data"),
             )
@@ -312,10 +350,10 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         Returns:
             An interpolated GibbsComputedEntry object.
         """
-        comp = Composition(formula).reduced_composition
-        pd_entries = self.get_subset_in_chemsys([str(e) for e in comp.elements])
+        comp = _get_reduced_composition(formula)
+        pd = self.get_pd_in_chemsys([str(e) for e in comp.elements])
 
-        energy = PhaseDiagram(pd_entries).get_hull_energy(comp) - tol_per_atom * comp.num_atoms
+        energy = pd.get_hull_energy(comp) - tol_per_atom * comp.num_atoms
 
         adj = ConstantEnergyAdjustment(  # for keeping track of uncertainty
             value=0.0,
@@ -390,18 +428,32 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
 
         """
         gibbs_entries = []
-        experimental_formulas = []
-
-        for entry in pd.all_entries:
-            composition = entry.composition
-            formula = composition.reduced_formula
+        experimental_formulas: set[str] = set()
+        nist_formulas = NISTReferenceEntry.REFERENCE_FORMULAS if include_nist_data else frozenset()
+        freed_formulas = FREEDReferenceEntry.REFERENCE_FORMULAS if include_freed_data else frozenset()
+        el_ref_energies = {el: e.energy_per_atom for el, e in pd.el_refs.items()}
+        el_ref_ids = {id(e) for e in pd.el_refs.values()}
+
+        # pass 1: filter entries and compute formation energies
+        candidates = [
+            (
+                entry,
+                entry.composition.reduced_formula,
+                (entry.energy - sum(amt * el_ref_energies[el] for el, amt in entry.composition.items()))
+                / entry.composition.num_atoms,
+            )
+            for entry in pd.all_entries
+            if not (entry.composition.is_element and id(entry) not in el_ref_ids)
+        ]
 
-            if composition.is_element and entry not in pd.el_refs.values() or formula in experimental_formulas:
+        # pass 2: build experimental/Gibbs entries
+        for entry, formula, formation_energy_per_atom in candidates:
+            if formula in experimental_formulas:
                 continue
 
             new_entries = []
             new_entry = None
-            if include_nist_data:
+            if include_nist_data and formula in nist_formulas:
                 new_entry = cls._check_for_experimental(
                     formula, "nist", temperature, ignore_nist_solids, apply_atmospheric_co2_correction
                 )
@@ -409,14 +461,16 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
                     new_entries.append(new_entry)
 
             if include_freed_data:
-                new_entry = cls._check_for_experimental(
-                    formula, "freed", temperature, ignore_nist_solids, apply_atmospheric_co2_correction
-                )
+                new_entry = None  # only a FREED entry prevents a GibbsComputedEntry
+                if formula in freed_formulas:
+                    new_entry = cls._check_for_experimental(
+                        formula, "freed", temperature, ignore_nist_solids, apply_atmospheric_co2_correction
+                    )
                 if new_entry:
                     new_entries.append(new_entry)
 
             if new_entry:
-                experimental_formulas.append(formula)
+                experimental_formulas.add(formula)
             else:
                 energy_adjustments = []
                 if apply_carbonate_correction:
@@ -428,11 +482,8 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
                         CarbonDioxideAtmosphericCorrection(entry.composition.num_atoms, temperature)
                     )
 
-                structure = entry.structure
-                formation_energy_per_atom = pd.get_form_energy_per_atom(entry)
-
                 gibbs_entry = GibbsComputedEntry.from_structure(
-                    structure=structure,
+                    structure=entry.structure,
                     formation_energy_per_atom=formation_energy_per_atom,
                     temperature=temperature,
                     energy_adjustments=energy_adjustments,
@@ -474,6 +525,7 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         ignore_nist_solids: bool = True,
         calculate_e_above_hulls: bool = False,
         minimize_obj_size: bool = False,
+        parallel: bool = False,
     ) -> GibbsEntrySet:
         """Constructor method for initializing GibbsEntrySet from T = 0 K
         ComputedStructureEntry objects, as acquired from a thermochemical database
@@ -503,42 +555,45 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
                 entry and store in the entry's data. Defaults to False.
             minimize_obj_size: Whether to minimize the size of the object by removing
                 unrequired attributes from the entries. Defaults to False.
+            parallel: Whether to build the entries for each of the expanded phase
+                diagrams in parallel using ray. Only applies to large chemical systems
+                (10 or more elements). Defaults to False.
 
         Returns:
             A GibbsEntrySet containing a collection of GibbsComputedEntry and
             experimental reference entry objects at the specified temperature.
         """
-        e_set = EntrySet(entries)
+        entries = list(entries)
+        chemsys = {el.symbol for e in entries for el in e.composition.elements}
         new_entries: set[GibbsComputedEntry] = set()
 
-        if len(e_set.chemsys) <= 9:  # Qhull algorithm struggles beyond 9 dimensions
-            pd = PhaseDiagram(e_set)
-            return cls.from_pd(
-                pd,
-                temperature,
-                include_nist_data=include_nist_data,
-                include_freed_data=include_freed_data,
-                apply_carbonate_correction=apply_carbonate_correction,
-                apply_atmospheric_co2_correction=apply_atmospheric_co2_correction,
-                ignore_nist_solids=ignore_nist_solids,
-                calculate_e_above_hulls=calculate_e_above_hulls,
-                minimize_obj_size=minimize_obj_size,
-            )
-
-        pd_dict = expand_pd(list(e_set))
+        from_pd_kwargs = {
+            "include_nist_data": include_nist_data,
+            "include_freed_data": include_freed_data,
+            "apply_carbonate_correction": apply_carbonate_correction,
+            "apply_atmospheric_co2_correction": apply_atmospheric_co2_correction,
+            "ignore_nist_solids": ignore_nist_solids,
+            "calculate_e_above_hulls": calculate_e_above_hulls,
+            "minimize_obj_size": minimize_obj_size,
+        }
+
+        if len(chemsys) <= 9:  # Qhull algorithm struggles beyond 9 dimensions
+            pd = PhaseDiagram(entries)
+            return cls.from_pd(pd, temperature, **from_pd_kwargs)
+
+        pd_dict = expand_pd(entries)
         logger.info("Building entries from expanded phase diagrams...")
-        for _, pd in tqdm(pd_dict.items(), desc="GibbsComputedEntry"):
-            gibbs_set = cls.from_pd(
-                pd,
-                temperature,
-                include_nist_data=include_nist_data,
-                include_freed_data=include_freed_data,
-                apply_carbonate_correction=apply_carbonate_correction,
-                apply_atmospheric_co2_correction=apply_atmospheric_co2_correction,
-                ignore_nist_solids=ignore_nist_solids,
-                calculate_e_above_hulls=calculate_e_above_hulls,
-                minimize_obj_size=minimize_obj_size,
+
+        if parallel:
+            if not ray.is_initialized():
+                initialize_ray()
+            gibbs_sets = to_iterator(
+                [_get_entry_set_from_pd.remote(cls, pd, temperature, from_pd_kwargs) for pd in pd_dict.values()]
             )
+        else:
+            gibbs_sets = (cls.from_pd(pd, temperature, **from_pd_kwargs) for pd in pd_dict.values())
+
+        for gibbs_set in tqdm(gibbs_sets, total=len(pd_dict), desc="GibbsComputedEntry"):
             new_entries.update(gibbs_set)
 
         return cls(list(new_entries))
@@ -548,19 +603,44 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         """Returns a list of all entries in the entry set."""
         return sorted(self.entries, key=lambda e: e.composition)
 
+    @cached_property
+    def entries_by_formula(self) -> dict[str, list[ComputedEntry]]:
+        """Returns a dict of all entries in the entry set (i.e., including polymorphs),
+        grouped by reduced formula.
+        """
+        entries_by_formula: dict[str, list[ComputedEntry]] = collections.defaultdict(list)
+        for e in self.entries:
+            entries_by_formula[e.composition.reduced_formula].append(e)
+
+        return dict(entries_by_formula)
+
+    @cached_property
+    def entries_by_chemsys(self) -> dict[frozenset[str], list[ComputedEntry]]:
+        """Returns a dict of all entries in the entry set, grouped by the exact set of
+        elements in their composition.
+        """
+        entries_by_chemsys: dict[frozenset[str], list[ComputedEntry]] = collections.defaultdict(list)
+        for e in self.entries:
+            entries_by_chemsys[_get_entry_elements(e)].append(e)
+
+        return dict(entries_by_chemsys)
+
     @cached_property
     def min_entries_by_formula(self) -> dict[str, ComputedEntry]:
         """Returns a dict of minimum energy entries in the entry set, indexed by
         formula.
         """
-        min_entries = {}
-        for e in self.entries:
-            formula = e.composition.reduced_formula
-            if formula not in min_entries:
-                entries = filter(lambda x: x.composition.reduced_formula == formula, self.entries)
-                min_entries[formula] = sorted(entries, key=lambda x: x.energy_per_atom)[0]
+        return {
+            formula: min(entries, key=lambda e: e.energy_per_atom)
+            for formula, entries in self.entries_by_formula.items()
+        }
 
-        return min_entries
+    @cached_property
+    def _pd_cache(self) -> dict[frozenset[str], PhaseDiagram]:
+        """Cache of phase diagrams built by get_pd_in_chemsys(), keyed by chemical
+        system.
+        """
+        return {}
 
     @cached_property
     def temperature(self) -> float:
@@ -583,10 +663,7 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         Set of symbols representing the chemical system, e.g., {"Li", "Fe", "P",
         "O"}.
         """
-        chemsys = set()
-        for e in self.entries:
-            chemsys.update([el.symbol for el in e.composition])
-        return chemsys
+        return {el.symbol for e in self.entries for el in e.composition.elements}
 
     @staticmethod
     def get_adjusted_entry(entry: GibbsComputedEntry, adjustment: EnergyAdjustment) -> GibbsComputedEntry:
@@ -599,16 +676,17 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
         Returns:
             A new GibbsComputedEntry object with the energy adjustment applied.
         """
-        entry_dict = entry.as_dict()
-        original_entry = entry_dict.get("entry", None)
-
-        if original_entry:
-            energy_adjustments = original_entry["energy_adjustments"]
-        else:
-            energy_adjustments = entry_dict["energy_adjustments"]
-
-        energy_adjustments.append(adjustment.as_dict())
-        return MontyDecoder().process_decoded(entry_dict)
+        if hasattr(entry, "original_entry"):  # wrapped entries derive their energy at init
+            entry_dict = entry.as_dict()
+            entry_dict["entry"]["energy_adjustments"].append(adjustment.as_dict())
+            return MontyDecoder().process_decoded(entry_dict)
+
+        # only the energy adjustments (and data) differ; a shallow copy avoids
+        # serializing/deserializing the entry (and any structure it carries)
+        new_entry = copy(entry)
+        new_entry.energy_adjustments = [*entry.energy_adjustments, adjustment]
+        new_entry.data = dict(entry.data)
+        return new_entry
 
     @staticmethod
     def _check_for_experimental(
@@ -627,7 +705,7 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
             raise ValueError("Invalid class name for experimental reference entry.")
 
         entry = None
-        if formula in cl.REFERENCES:
+        if formula in cl.REFERENCE_FORMULAS:
             if cl == NISTReferenceEntry and ignore_nist_solids and formula in IGNORE_NIST_SOLIDS:
                 return None
 
@@ -673,13 +751,60 @@ class GibbsEntrySet(collections.abc.MutableSet, MSONable):
 
         return CarbonateCorrection(num_c)
 
-    def _clear_cache(self) -> None:
+    def _clear_cache(self, extend_chemsys_with: Iterable[ComputedEntry] | None = None) -> None:
         """Clears all cached properties. This method is called whenever the entry set is
         modified in place (as is done with the add method, etc.).
+
+        Args:
+            extend_chemsys_with: Optional entries that were just added to the set. If
+                provided (and the chemsys was already cached), the cached chemsys is
+                extended with the elements of these entries rather than being cleared.
+                Removing entries must always clear the cache.
         """
+        chemsys = self.__dict__.get("chemsys")
+
         for name, value in inspect.getmembers(GibbsEntrySet):
             if isinstance(value, cached_property):
                 try:
                     delattr(self, name)
                 except AttributeError:
                     continue
+
+        if chemsys is not None and extend_chemsys_with is not None:
+            self.__dict__["chemsys"] = chemsys | {
+                el.symbol for e in extend_chemsys_with for el in e.composition.elements
+            }
+
+
+@lru_cache(maxsize=4096)
+def _get_reduced_composition(formula: str) -> Composition:
+    """Returns the reduced composition of a formula. Cached, since the same formulas
+    (e.g., formulas_to_include in process_entries) are parsed repeatedly.
+    """
+    return Composition(formula).reduced_composition
+
+
+@ray.remote
+def _get_entry_set_from_pd(cls, pd: PhaseDiagram, temperature: float, from_pd_kwargs: dict) -> GibbsEntrySet:
+    """Remote wrapper around GibbsEntrySet.from_pd(), allowing the entries of each
+    expanded phase diagram to be built in parallel using ray.
+
+    The phase diagram is deep-copied first: ray deserializes its arrays (e.g., lattice
+    matrices) as zero-copy views that may be less aligned than regular numpy arrays,
+    which can change structure volumes, and thus entry energies, in the last bit.
+
+    WARNING: this function is not intended to to be called directly by the user.
+    """
+    return cls.from_pd(deepcopy(pd), temperature, **from_pd_kwargs)
+
+
+def _get_entry_elements(entry: ComputedEntry) -> frozenset[str]:
+    """Returns the element symbols of an entry's composition. The result is cached on
+    the entry itself, since the same entries are repeatedly subset-tested when building
+    phase diagrams for (sub-)chemical systems.
+    """
+    elements = getattr(entry, "_chemsys_cache", None)
+    if elements is None:
+        elements = frozenset(el.symbol for el in entry.composition.elements)
+        entry._chemsys_cache = elements
+    return elements
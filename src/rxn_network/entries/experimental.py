@@ -28,6 +28,7 @@ class ExperimentalReferenceEntry(ComputedEntry):
     """
 
     REFERENCES: dict = {}
+    REFERENCE_FORMULAS: frozenset = frozenset()
     DEPRECATED: list = []
 
     def __init__(
@@ -69,6 +70,12 @@ class ExperimentalReferenceEntry(ComputedEntry):
         if self.is_deprecated:
             self.name += " (deprecated)"
 
+        # composition and temperature are fixed, so the (md5-based) hash is computed once
+        self._hash = int(
+            hashlib.md5(f"{self.__class__.__name__}{self.composition}_{self.temperature}".encode()).hexdigest(),  # nosec
+            16,
+        )
+
     def get_new_temperature(self, new_temperature: float) -> ExperimentalReferenceEntry:
         """Return a copy of the NISTReferenceEntry at the new specified temperature.
 
@@ -212,7 +219,4 @@ class ExperimentalReferenceEntry(ComputedEntry):
         return False
 
     def __hash__(self) -> int:
-        data_md5 = hashlib.md5(  # nosec
-            f"{self.__class__.__name__}{self.composition}_{self.temperature}".encode()
-        ).hexdigest()
-        return int(data_md5, 16)
+        return self._hash
@@ -4,6 +4,7 @@ tables.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from rxn_network.data import PATH_TO_FREED, load_experimental_data
@@ -14,7 +15,35 @@ if TYPE_CHECKING:
 
     from rxn_network.core import Composition
 
-G_COMPOUNDS = load_experimental_data(PATH_TO_FREED / "compounds.json.gz")
+
+@lru_cache(maxsize=1)
+def _load_compounds() -> dict:
+    """Loads the FREED data. This is deferred until first use, since FREED data is not
+    included in entry sets by default.
+    """
+    return load_experimental_data(PATH_TO_FREED / "compounds.json.gz")
+
+
+@lru_cache(maxsize=1)
+def _load_compound_formulas() -> frozenset[str]:
+    """Loads the formulas of all compounds in the FREED data (see _load_compounds)."""
+    return frozenset(_load_compounds())
+
+
+def __getattr__(name: str):
+    if name == "G_COMPOUNDS":  # kept for backwards compatibility; loaded lazily
+        return _load_compounds()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyReferenceData:
+    """Class attribute descriptor which loads the FREED data on first access."""
+
+    def __init__(self, loader):
+        self.loader = loader
+
+    def __get__(self, obj, objtype=None):
+        return self.loader()
 
 
 class FREEDReferenceEntry(ExperimentalReferenceEntry):
@@ -26,7 +55,8 @@ class FREEDReferenceEntry(ExperimentalReferenceEntry):
         https://www.thermart.net/freed-thermodynamic-database/
     """
 
-    REFERENCES = G_COMPOUNDS
+    REFERENCES = _LazyReferenceData(_load_compounds)
+    REFERENCE_FORMULAS = _LazyReferenceData(_load_compound_formulas)
 
     def __init__(
         self,
@@ -17,6 +17,7 @@ if TYPE_CHECKING:
     from rxn_network.core import Composition
 
 G_COMPOUNDS = load_experimental_data(PATH_TO_NIST / "compounds.json.gz")
+COMPOUND_FORMULAS = frozenset(G_COMPOUNDS)
 DEPRECATED_COMPOUNDS = loadfn(PATH_TO_NIST / "deprecated_compounds.json")
 
 
@@ -32,6 +33,7 @@ class NISTReferenceEntry(ExperimentalReferenceEntry):
     """
 
     REFERENCES = G_COMPOUNDS
+    REFERENCE_FORMULAS = COMPOUND_FORMULAS
     DEPRECATED = DEPRECATED_COMPOUNDS
 
     def __init__(
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import itertools
+import operator
 import re
 import warnings
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pymatgen.core.composition import Element
@@ -25,6 +27,8 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+MAX_CHEMSYS_PER_QUERY = 5000  # all sub-chemsyses of up to 12 elements fit in one query
+
 
 def process_entries(
     entries: Iterable[ComputedStructureEntry],
@@ -182,24 +186,12 @@ def get_all_entries_in_chemsys_from_entry_db(
             symbols separated by dashes, e.g., "Li-Fe-O" or List of element symbols,
             e.g., ["Li", "Fe", "O"].
     """
-
-    def divide_chunks(my_list, n):
-        for i in range(0, len(my_list), n):
-            yield my_list[i : i + n]
-
     if isinstance(elements, str):
         elements = elements.split("-")
 
     if len(elements) <= 13:
-        all_chemsyses = []
-        for i in range(len(elements)):
-            for els in itertools.combinations(elements, i + 1):
-                all_chemsyses.append("-".join(sorted(els)))
-
-        all_chemsyses = list(divide_chunks(all_chemsyses, 1000))
-
         entries = []
-        for chemsys_group in all_chemsyses:
+        for chemsys_group in _get_chemsys_chunks(elements, MAX_CHEMSYS_PER_QUERY):
             entries.extend(
                 get_entries_from_entry_db(
                     db,
@@ -291,7 +283,10 @@ def get_entries(
     if use_premade_entries:
         props = ["entries", "deprecated"]
 
-    entries = []
+    get_params = operator.itemgetter(*params)
+
+    entries: list[ComputedEntry] = []
+    entries_append = entries.append
     for d in db.query(criteria, props):
         if d.get("deprecated"):
             continue
@@ -308,6 +303,7 @@ def get_entries(
             d["potcar_symbols"] = [
                 f"{d['pseudo_potential']['functional']} {label}" for label in d["pseudo_potential"].get("labels", [])
             ]
+            parameters = dict(zip(params, get_params(d)))
             data = {"oxide_type": d["oxide_type"]}
             if property_data:
                 data.update({k: d[k] for k in property_data})
@@ -315,7 +311,7 @@ def get_entries(
                 e = ComputedEntry(
                     d["unit_cell_formula"],
                     d["final_energy"],
-                    parameters={k: d[k] for k in params},
+                    parameters=parameters,
                     data=data,
                     entry_id=d["task_id"],
                 )
@@ -330,16 +326,16 @@ def get_entries(
                 e = ComputedStructureEntry(
                     s,
                     energy,
-                    parameters={k: d[k] for k in params},
+                    parameters=parameters,
                     data=data,
                     entry_id=d["task_id"],
                 )
-        entries.append(e)
+        entries_append(e)
 
     if compatible_only:
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message="Failed to guess oxidation states.*")
-            entries = MaterialsProject2020Compatibility().process_entries(entries, clean=True)
+            entries = _get_mp_compatibility().process_entries(entries, clean=True)
 
     if sort_by_e_above_hull:
         entries = sorted(entries, key=lambda entry: entry.data["e_above_hull"])
@@ -355,7 +351,7 @@ def get_all_entries_in_chemsys(
     property_data: list | None = None,
     use_premade_entries: bool = False,
     conventional_unit_cell: bool = False,
-    n: int = 1000,
+    n: int | None = None,
 ) -> list[ComputedEntry]:  # pragma: no cover
     """Warning:
         This function is legacy code directly adapted from pymatgen.ext.matproj. It is
@@ -388,28 +384,19 @@ def get_all_entries_in_chemsys(
             constructed. Defaults to False.
         conventional_unit_cell (bool): Whether to get the standard
             conventional unit cell
-        n (int): Chunk size, i.e., number of sub-chemical systems to consider
+        n (int): Chunk size, i.e., number of sub-chemical systems to consider per
+            query. If None, all sub-chemical systems are requested in a single query
+            unless there are more than MAX_CHEMSYS_PER_QUERY of them. Defaults to None.
+
     Returns:
         List of ComputedEntries.
     """
-
-    def divide_chunks(my_list, n):
-        for i in range(0, len(my_list), n):
-            yield my_list[i : i + n]
-
     if isinstance(elements, str):
         elements = elements.split("-")
 
     if len(elements) <= 13:
-        all_chemsyses = []
-        for i in range(len(elements)):
-            for els in itertools.combinations(elements, i + 1):
-                all_chemsyses.append("-".join(sorted(els)))
-
-        all_chemsyses = list(divide_chunks(all_chemsyses, n))
-
         entries = []
-        for chemsys_group in all_chemsyses:
+        for chemsys_group in _get_chemsys_chunks(elements, n or MAX_CHEMSYS_PER_QUERY):
             entries.extend(
                 get_entries(
                     db,
@@ -435,6 +422,32 @@ def get_all_entries_in_chemsys(
     return entries
 
 
+@lru_cache(maxsize=1)
+def _get_mp_compatibility() -> MaterialsProject2020Compatibility:
+    """Returns a (shared) MaterialsProject2020Compatibility instance, so that its
+    correction tables are only loaded once.
+    """
+    return MaterialsProject2020Compatibility()
+
+
+def _get_chemsys_chunks(elements: list[str], n: int) -> list[list[str]]:
+    """Returns all sub-chemical systems (e.g., "Fe-Li-O") of the provided elements,
+    divided into chunks of (at most) n chemical systems for querying a database.
+
+    Args:
+        elements: List of element symbols, e.g., ["Li", "Fe", "O"].
+        n: Chunk size, i.e., number of sub-chemical systems per chunk.
+    """
+    sorted_elements = sorted(elements)  # combinations of a sorted list remain sorted
+    all_chemsyses = [
+        "-".join(els)
+        for els in itertools.chain.from_iterable(
+            itertools.combinations(sorted_elements, r) for r in range(1, len(sorted_elements) + 1)
+        )
+    ]
+    return [all_chemsyses[i : i + n] for i in range(0, len(all_chemsyses), n)]
+
+
 def parse_criteria(criteria_string):  # pragma: no cover
     """Parses a powerful and simple string criteria and generates a proper
     mongo syntax criteria.
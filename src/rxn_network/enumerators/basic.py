@@ -8,7 +8,6 @@ from math import comb
 from typing import TYPE_CHECKING
 
 import ray
-from pymatgen.analysis.phase_diagram import GrandPotentialPhaseDiagram, PhaseDiagram
 from tqdm import tqdm
 
 from rxn_network.entries.entry_set import GibbsEntrySet
@@ -17,7 +16,8 @@ from rxn_network.enumerators.base import Enumerator
 from rxn_network.enumerators.utils import group_by_chemsys
 from rxn_network.reactions.computed import ComputedReaction
 from rxn_network.reactions.reaction_set import ReactionSet
-from rxn_network.utils.funcs import get_logger, grouper, limited_powerset
+from rxn_network.thermo.utils import CachedGrandPotentialPhaseDiagram, CachedPhaseDiagram
+from rxn_network.utils.funcs import get_logger, limited_powerset
 from rxn_network.utils.ray import initialize_ray, to_iterator
 
 if TYPE_CHECKING:
@@ -175,11 +175,13 @@ class BasicEnumerator(Enumerator):
 
         pd_dict = {}
         if self._build_pd or self._build_grand_pd:
-            # pre-loop for phase diagram construction
-            pd_chunk_size = int(len(combos_dict) // num_cpus) + 1
+            # pre-loop for phase diagram construction; largest chemical systems are
+            # dealt out round-robin so that the expensive hulls are spread across CPUs
+            items = sorted(combos_dict.items(), key=lambda i: i[0].count("-"), reverse=True)
+            item_chunks = [items[i::num_cpus] for i in range(min(num_cpus, len(items)))]
 
             pd_dict_refs = []
-            for item_chunk in grouper(combos_dict.items(), pd_chunk_size):
+            for item_chunk in item_chunks:
                 pd_dict_refs.append(
                     _get_entries_and_pds.remote(
                         item_chunk,
@@ -624,10 +626,10 @@ def _get_entries_and_pds(combos_dict_chunk, entries, build_pd, build_grand_pd, c
             filtered_entries = entries.get_subset_in_chemsys(elems)
 
         if build_pd:
-            pd = PhaseDiagram(filtered_entries)
+            pd = CachedPhaseDiagram(filtered_entries)
 
         if build_grand_pd:
-            grand_pd = GrandPotentialPhaseDiagram(filtered_entries, chempots)
+            grand_pd = CachedGrandPotentialPhaseDiagram(filtered_entries, chempots)
 
         pd_dict[chemsys] = (filtered_entries, pd, grand_pd)
     return pd_dict
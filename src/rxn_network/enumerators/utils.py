@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from itertools import compress
 from typing import TYPE_CHECKING
 
+import numpy as np
 from pymatgen.analysis.interface_reactions import GrandPotentialInterfacialReactivity, InterfacialReactivity
 from pymatgen.entries.computed_entries import ComputedEntry
 
@@ -40,8 +42,22 @@ def get_computed_rxn(
     Returns:
         A ComputedReaction object transformed from a normal Reaction object
     """
-    reactant_entries = [entries.get_min_entry_by_formula(r.reduced_formula) for r in rxn.reactants]
-    product_entries = [entries.get_min_entry_by_formula(p.reduced_formula) for p in rxn.products]
+    return _get_computed_rxn_from_comps(rxn.reactants, rxn.products, entries, chempots)
+
+
+def _get_computed_rxn_from_comps(
+    reactants: Iterable[Composition],
+    products: Iterable[Composition],
+    entries: GibbsEntrySet,
+    chempots: dict[Element, float] | None = None,
+) -> ComputedReaction | OpenComputedReaction:
+    """Balances a ComputedReaction (or OpenComputedReaction) from the minimum energy
+    entries matching the provided reactant and product compositions.
+    """
+    min_entries = entries.min_entries_by_formula
+
+    reactant_entries = [min_entries[r.reduced_formula] for r in reactants]
+    product_entries = [min_entries[p.reduced_formula] for p in products]
 
     if chempots:
         rxn = OpenComputedReaction.balance(reactant_entries, product_entries, chempots)
@@ -83,8 +99,15 @@ def react_interface(
 
     rxns = []
     for _, _, _, rxn, _ in interface.get_kinks():
-        rxn = get_computed_rxn(rxn, filtered_entries, chempots)
-        rxns.append(rxn)
+        comps = rxn.all_comp
+        coeffs = np.asarray(rxn.coeffs)
+
+        reactants = list(compress(comps, coeffs < 0))
+        products = list(compress(comps, coeffs > 0))
+        if set(reactants) == set(products):  # identity reactions at the mixing endpoints
+            continue
+
+        rxns.append(_get_computed_rxn_from_comps(reactants, products, filtered_entries, chempots))
 
     return rxns
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+from itertools import combinations
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from rxn_network.pathways.basic import BasicPathway
-from rxn_network.utils.funcs import limited_powerset
 
 if TYPE_CHECKING:
     from rxn_network.core import Composition
@@ -40,6 +41,7 @@ class BalancedPathway(BasicPathway):
         super().__init__(reactions=reactions, costs=costs)
 
         self.balanced = balanced
+        self._hash = self._get_hash()
 
     def get_comp_matrix(self) -> np.ndarray:
         """Gets the composition matrix used in the balancing procedure.
@@ -47,12 +49,25 @@ class BalancedPathway(BasicPathway):
         Returns:
             An array representing the composition matrix for a reaction
         """
-        return np.array(
-            [
-                [rxn.get_coeff(comp) if comp in rxn.all_comp else 0 for comp in self.compositions]
-                for rxn in self.reactions
-            ]
-        )
+        return self.comp_matrix
+
+    @cached_property
+    def _comp_index(self) -> dict[Composition, int]:
+        """Column index of each pathway composition in the composition matrix."""
+        return {comp: idx for idx, comp in enumerate(self.compositions)}
+
+    @cached_property
+    def comp_matrix(self) -> np.ndarray:
+        """Read-only composition matrix (reactions x compositions) of the pathway,
+        built once from the reaction coefficients.
+        """
+        comp_matrix = np.zeros((len(self.reactions), len(self._comp_index)))
+        for i, rxn in enumerate(self.reactions):
+            for comp, coeff in rxn.coeff_dict.items():
+                comp_matrix[i, self._comp_index[comp]] = coeff
+
+        comp_matrix.flags.writeable = False
+        return comp_matrix
 
     def get_coeff_vector_for_rxn(self, rxn: Reaction) -> np.ndarray:
         """Gets the net reaction coefficients vector.
@@ -63,50 +78,69 @@ class BalancedPathway(BasicPathway):
         Returns:
             An array representing the reaction coefficients vector
         """
-        return np.array([rxn.get_coeff(comp) if comp in rxn.compositions else 0 for comp in self.compositions])
+        coeff_dict = rxn.coeff_dict
+        return np.array([coeff_dict.get(comp, 0.0) for comp in self._comp_index])
 
     def contains_interdependent_rxns(self, precursors: list[Composition]) -> bool:
         """Whether or not the pathway contains interdependent reactions given a list of
         provided precursors.
 
+        Reactant/product sets are encoded as integer bitmasks over the pathway
+        compositions, so that each subset of reactions is checked with bitwise
+        operations rather than by building Python sets.
+
         Args:
             precursors: List of precursor compositions
         """
-        precursors_set = set(precursors)
-        interdependent = False
-
-        rxns = set(self.reactions)
+        rxns = list(set(self.reactions))
         num_rxns = len(rxns)
 
         if num_rxns == 1:
             return False
 
-        for combo in limited_powerset(rxns, num_rxns):
-            size = len(combo)
-            if any(set(rxn.reactants).issubset(precursors_set) for rxn in combo) or size == 1:
-                continue
-
-            other_comp = {c for rxn in (rxns - set(combo)) for c in rxn.compositions}
+        comp_bits = {comp: 1 << idx for idx, comp in enumerate({c for rxn in rxns for c in rxn.compositions})}
+        precursor_mask = sum(comp_bits.get(c, 0) for c in set(precursors))
 
-            unique_reactants = []
-            unique_products = []
-            for rxn in combo:
-                unique_reactants.append(set(rxn.reactants) - precursors_set)
-                unique_products.append(set(rxn.products) - precursors_set)
+        reactant_masks, product_masks = [], []
+        for rxn in rxns:
+            reactant_mask = sum(comp_bits[c] for c in set(rxn.reactants)) & ~precursor_mask
+            if not reactant_mask:  # reactions fed only by precursors are never interdependent
+                continue
 
-            overlap = [False] * size
-            for i in range(size):
-                for j in range(size):
-                    if i == j:
-                        continue
-                    overlapping_phases = unique_reactants[i] & unique_products[j]
-                    if overlapping_phases and (overlapping_phases not in other_comp):
-                        overlap[i] = True
+            reactant_masks.append(reactant_mask)
+            product_masks.append(sum(comp_bits[c] for c in set(rxn.products)) & ~precursor_mask)
 
-            if all(overlap):
-                interdependent = True
+        # prune reactions whose reactants are not produced by any remaining reaction;
+        # these cannot belong to an interdependent subset
+        candidates = list(range(len(reactant_masks)))
+        while True:
+            remaining = [
+                i for i in candidates if any(reactant_masks[i] & product_masks[j] for j in candidates if j != i)
+            ]
+            if len(remaining) == len(candidates):
+                break
+            candidates = remaining
+
+        reactant_masks = [reactant_masks[i] for i in candidates]
+        product_masks = [product_masks[i] for i in candidates]
+        num_candidates = len(candidates)
+
+        for size in range(2, num_candidates + 1):
+            for members in combinations(range(num_candidates), size):
+                # products of all other members = prefix | suffix OR, in O(size)
+                suffix_products = [0] * (size + 1)
+                for k in range(size - 1, -1, -1):
+                    suffix_products[k] = suffix_products[k + 1] | product_masks[members[k]]
+
+                prefix_products = 0
+                for k, i in enumerate(members):
+                    if not reactant_masks[i] & (prefix_products | suffix_products[k + 1]):
+                        break
+                    prefix_products |= product_masks[i]
+                else:
+                    return True
 
-        return interdependent
+        return False
 
     @classmethod
     def balance(
@@ -129,12 +163,30 @@ class BalancedPathway(BasicPathway):
         return np.dot(self.coefficients, self.costs) / sum(self.coefficients)
 
     def __eq__(self, other) -> bool:
-        if super().__eq__(other):
-            return np.allclose(self.costs, other.costs)
+        if self is other:
+            return True
 
-        return False
+        if not super().__eq__(other) or len(self.costs) != len(other.costs):
+            return False
+
+        # same tolerances as np.allclose, without the array dispatch for short lists
+        return all(abs(c1 - c2) <= 1e-08 + 1e-05 * abs(c2) for c1, c2 in zip(self.costs, other.costs))
 
     def __hash__(self):
+        return self._hash
+
+    def __getstate__(self) -> dict:
+        # the cached hash depends on the hash seed of the process (e.g., via the
+        # reactions' chemical system strings), so it is recomputed after unpickling
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._hash = self._get_hash()
+
+    def _get_hash(self) -> int:
         return hash((tuple(self.reactions), tuple(self.coefficients)))
 
     def __repr__(self) -> str:
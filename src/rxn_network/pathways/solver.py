@@ -29,6 +29,8 @@ from rxn_network.utils.funcs import get_logger, grouper
 from rxn_network.utils.ray import initialize_ray, to_iterator
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from rxn_network.costs.base import CostFunction
     from rxn_network.pathways.base import Pathway
     from rxn_network.reactions.base import Reaction
@@ -207,7 +209,8 @@ class PathwaySolver(Solver):
 
         net_coeff_filter = np.argwhere(net_rxn_vector != 0).flatten()
         net_coeff_filter = ray.put(net_coeff_filter)
-        cleaned_reactions_ref = ray.put(cleaned_reactions)
+        net_rxn_vector_ref = ray.put(net_rxn_vector)
+        rxn_arrays_ref = ray.put(_get_rxn_csr_arrays(cleaned_reactions))
 
         comp_matrices = {n: [] for n in range(1, max_num_combos + 1)}  # type: ignore
         comp_matrices_refs_dict = {}  # type: ignore
@@ -216,7 +219,7 @@ class PathwaySolver(Solver):
             comp_matrices_refs_dict[n] = []
             for group in grouper(combinations(range(num_rxns), n), self.chunk_size):
                 comp_matrices_refs_dict[n].append(
-                    _create_comp_matrices.remote(group, cleaned_reactions_ref, num_entries, net_coeff_filter)
+                    _create_comp_matrices.remote(group, rxn_arrays_ref, num_entries, net_coeff_filter)
                 )
 
         logger.info("Building comp matrices...")
@@ -263,7 +266,7 @@ class PathwaySolver(Solver):
                 c_m_mats_refs.append(
                     path_balancer.remote(
                         group,
-                        net_rxn_vector,
+                        net_rxn_vector_ref,
                     )
                 )
 
@@ -403,6 +406,40 @@ class PathwaySolver(Solver):
         return self._entries
 
 
+@jit(nopython=True)
+def _balance_comp_matrix(
+    comp_matrix: np.ndarray,
+    net_coeffs: np.ndarray,
+    tol: float = 1e-6,
+) -> tuple[np.ndarray, bool]:
+    """Solves for the reaction multiplicities of a single composition matrix and
+    checks whether they balance the net reaction. Explicit loops are used for the
+    tolerance checks so that they exit early once compiled.
+
+    Args:
+        comp_matrix: Array containing stoichiometric coefficients of all compositions
+            in each reaction of a trial combination.
+        net_coeffs: Array containing stoichiometric coefficients of net reaction.
+        tol: numerical tolerance for determining if a multiplicity is zero
+            (i.e., if reaction was removed).
+
+    Returns:
+        Tuple of the multiplicities and whether or not they balance the net reaction.
+    """
+    multiplicities = np.linalg.lstsq(comp_matrix.T, net_coeffs, rcond=1e-15)[0]
+
+    for m in multiplicities:
+        if m < tol:
+            return multiplicities, False
+
+    solved_coeffs = comp_matrix.T @ multiplicities
+    for k in range(net_coeffs.shape[0]):
+        if abs(solved_coeffs[k] - net_coeffs[k]) > 1e-08 + 1e-05 * abs(net_coeffs[k]):
+            return multiplicities, False
+
+    return multiplicities, True
+
+
 @jit(nopython=True)
 def _balance_path_arrays_cpu(
     comp_matrices: np.ndarray,
@@ -436,14 +473,8 @@ def _balance_path_arrays_cpu(
         if not correct:
             continue
 
-        comp_pinv = np.linalg.pinv(comp_matrices[i]).T
-        multiplicities = comp_pinv @ net_coeffs
-        solved_coeffs = comp_matrices[i].T @ multiplicities
-
-        if (multiplicities < tol).any():
-            continue
-
-        if not (np.abs(solved_coeffs - net_coeffs) <= (1e-08 + 1e-05 * np.abs(net_coeffs))).all():
+        multiplicities, balanced = _balance_comp_matrix(comp_matrices[i], net_coeffs, tol)
+        if not balanced:
             continue
 
         all_multiplicities[i] = multiplicities
@@ -462,14 +493,70 @@ def _balance_path_arrays_cpu(
     return filtered_comp_matrices, filtered_multiplicities
 
 
+def _get_rxn_csr_arrays(rxns: Sequence[ComputedReaction]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Stores the coefficients of each reaction on its entry indices in compressed
+    sparse row (CSR) format, i.e., (row_ptr, col_idx, data) arrays.
+    """
+    row_ptr = np.zeros(len(rxns) + 1, np.int64)
+    col_idx: list[int] = []
+    data: list[float] = []
+    for i, rxn in enumerate(rxns):
+        col_idx.extend(e.data["idx"] for e in rxn.entries)
+        data.extend(rxn.coefficients)
+        row_ptr[i + 1] = len(col_idx)
+
+    return row_ptr, np.array(col_idx, np.int64), np.array(data, np.float64)
+
+
+@jit(nopython=True)
+def _fill_comp_matrices(
+    combos: np.ndarray,
+    row_ptr: np.ndarray,
+    col_idx: np.ndarray,
+    data: np.ndarray,
+    num_entries: int,
+    net_coeff_filter: np.ndarray,
+) -> np.ndarray:
+    """Builds the composition matrix of each combination of reactions directly from
+    the CSR reaction arrays, skipping any matrix that lacks a nonzero coefficient for
+    a composition in the net reaction.
+
+    Args:
+        combos: Array of reaction indices for each trial combination.
+        row_ptr: CSR row pointers of the reactions.
+        col_idx: CSR entry indices of the reaction coefficients.
+        data: CSR reaction coefficients.
+        num_entries: Total number of entries (i.e., number of matrix columns).
+        net_coeff_filter: Entry indices of the nonzero net reaction coefficients.
+    """
+    num_combos, n = combos.shape
+    comp_matrices = np.zeros((num_combos, n, num_entries), np.float64)
+
+    count = 0
+    for i in range(num_combos):
+        comp_matrices[count] = 0.0
+        for j in range(n):
+            r = combos[i, j]
+            for k in range(row_ptr[r], row_ptr[r + 1]):
+                comp_matrices[count, j, col_idx[k]] = data[k]
+
+        correct = True
+        for idx in net_coeff_filter:
+            if not comp_matrices[count, :, idx].any():
+                correct = False
+                break
+
+        if correct:
+            count += 1
+
+    return comp_matrices[:count]
+
+
 @ray.remote
-def _create_comp_matrices(combos, rxns, num_entries, net_coeff_filter):
+def _create_comp_matrices(combos, rxn_arrays, num_entries, net_coeff_filter):
     """Create array of stoichiometric coefficients for each reaction."""
-    comp_matrices = np.stack(
-        [np.vstack([rxns[r].get_entry_idx_vector(num_entries) for r in combo]) for combo in combos if combo]
-    )
-    # filter bad matrices
-    return comp_matrices[comp_matrices[:, :, net_coeff_filter].any(axis=1).all(axis=1)]
+    combos = np.array([combo for combo in combos if combo], np.int64)
+    return _fill_comp_matrices(combos, *rxn_arrays, num_entries, net_coeff_filter)
 
 
 @ray.remote
@@ -477,5 +564,11 @@ def _balance_path_arrays_cpu_wrapper(
     comp_matrices,
     net_rxn_vector,
 ):
-    """Wraps pathway balancing method with ray.remote decorator."""
-    return _balance_path_arrays_cpu(comp_matrices, net_rxn_vector)
+    """Wraps pathway balancing method with ray.remote decorator. Inputs are passed to
+    the jitted kernel as C-contiguous float64 arrays so that a single compiled
+    specialization is reused for every batch.
+    """
+    return _balance_path_arrays_cpu(
+        np.ascontiguousarray(comp_matrices, dtype=np.float64),
+        np.ascontiguousarray(net_rxn_vector, dtype=np.float64),
+    )
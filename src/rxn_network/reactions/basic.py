@@ -153,8 +153,10 @@ class BasicReaction(Reaction):
         return sum(self.compositions[i][element] * abs(self.coefficients[i]) for i in range(len(self.compositions))) / 2
 
     def get_coeff(self, comp: Composition):
-        """Returns coefficient for a particular composition."""
-        return self.coefficients[self.compositions.index(comp)]
+        """Returns coefficient for a particular composition (zero if the composition is
+        not part of the reaction).
+        """
+        return self.coeff_dict.get(comp, 0.0)
 
     def normalized_repr_and_factor(self):
         """Normalized representation for a reaction
@@ -318,6 +320,17 @@ class BasicReaction(Reaction):
         """Array of reaction coefficients."""
         return self._coefficients
 
+    @cached_property
+    def coeff_dict(self) -> dict[Composition, float]:
+        """Dictionary of reaction coefficients, indexed by composition. If a composition
+        appears more than once, the coefficient of its first occurrence is used.
+        """
+        coeff_dict: dict[Composition, float] = {}
+        for comp, coeff in zip(self.compositions, self.coefficients):
+            coeff_dict.setdefault(comp, coeff)
+
+        return coeff_dict
+
     @cached_property
     def num_atoms(self) -> float:
         """Total number of atoms in this reaction."""
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pymatgen.analysis.phase_diagram import PhaseDiagram
+from pymatgen.analysis.phase_diagram import GrandPotentialPhaseDiagram, PhaseDiagram
 from tqdm import tqdm
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from pymatgen.analysis.phase_diagram import PDEntry
+    from pymatgen.core.composition import Composition
     from pymatgen.entries import Entry
 
 
@@ -46,3 +48,39 @@ def expand_pd(entries: Iterable[Entry], pbar: bool = False) -> dict[str, PhaseDi
             )
 
     return pd_dict
+
+
+class _HullEnergyCacheMixin:
+    """Memoizes decompositions and hull energies by (fractional) composition. The
+    same compositions are queried repeatedly when the reactions between every pair of
+    phases in a chemical system are calculated on one phase diagram.
+    """
+
+    def get_decomp_and_hull_energy_per_atom(
+        self, comp: Composition, **kwargs
+    ) -> tuple[dict[PDEntry, float], float]:
+        """Same as the parent method, but cached by fractional composition when no
+        keyword arguments are provided.
+        """
+        if kwargs:
+            return super().get_decomp_and_hull_energy_per_atom(comp, **kwargs)  # type: ignore
+
+        cache = self.__dict__.setdefault("_hull_energy_cache", {})
+        key = frozenset(comp.fractional_composition.items())
+
+        result = cache.get(key)
+        if result is None:
+            result = super().get_decomp_and_hull_energy_per_atom(comp)  # type: ignore
+            cache[key] = result
+
+        return result
+
+
+class CachedPhaseDiagram(_HullEnergyCacheMixin, PhaseDiagram):
+    """PhaseDiagram which caches hull energies of previously queried compositions."""
+
+
+class CachedGrandPotentialPhaseDiagram(_HullEnergyCacheMixin, GrandPotentialPhaseDiagram):
+    """GrandPotentialPhaseDiagram which caches hull energies of previously queried
+    compositions.
+    """
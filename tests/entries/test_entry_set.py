@@ -1,12 +1,17 @@
 """Tests for GibbsEntrySet."""
 
 from copy import deepcopy
+from pathlib import Path
 
 import pytest
+from monty.serialization import loadfn
 from pymatgen.analysis.phase_diagram import PhaseDiagram
-from pymatgen.entries.computed_entries import ConstantEnergyAdjustment
+from pymatgen.core import Lattice, Structure
+from pymatgen.entries.computed_entries import ComputedStructureEntry, ConstantEnergyAdjustment
 from rxn_network.entries.entry_set import GibbsEntrySet
 
+TEST_FILES_PATH = Path(__file__).parent.parent / "test_files"
+
 
 @pytest.mark.parametrize("chemsys", [["Mn", "O", "Y"], "Mn-O", ["Y", "O"], "O", ["O"]])
 def test_get_subset_in_chemsys(chemsys, gibbs_entries):
@@ -24,6 +29,21 @@ def test_get_subset_in_chemsys(chemsys, gibbs_entries):
             assert e not in subset
 
 
+@pytest.mark.parametrize("chemsys", [["Mn", "O"], "Y-O", ["O"]])
+def test_get_pd_in_chemsys(chemsys, gibbs_entries):
+    entries = gibbs_entries.copy()
+    pd = entries.get_pd_in_chemsys(chemsys)
+
+    if isinstance(chemsys, str):
+        chemsys = chemsys.split("-")
+
+    assert {str(el) for el in pd.elements} == set(chemsys)
+    assert entries.get_pd_in_chemsys(list(reversed(chemsys))) is pd
+
+    entries.add(entries.get_min_entry_by_formula("O2").copy())
+    assert entries.get_pd_in_chemsys(chemsys) is not pd
+
+
 @pytest.mark.parametrize(
     "e_above_hull, expected_phases",
     [
@@ -92,6 +112,23 @@ def test_get_min_entry_by_formula(gibbs_entries):
         assert gibbs_entries.get_min_entry_by_formula(f).entry_id == entry_id
 
 
+def test_entries_by_formula(gibbs_entries):
+    entries_by_formula = gibbs_entries.entries_by_formula
+
+    assert sum(len(entries) for entries in entries_by_formula.values()) == len(gibbs_entries)
+    for formula, entries in entries_by_formula.items():
+        assert all(e.composition.reduced_formula == formula for e in entries)
+        assert gibbs_entries.min_entries_by_formula[formula] in entries
+
+
+def test_entries_by_chemsys(gibbs_entries):
+    entries_by_chemsys = gibbs_entries.entries_by_chemsys
+
+    assert sum(len(entries) for entries in entries_by_chemsys.values()) == len(gibbs_entries)
+    for chemsys, entries in entries_by_chemsys.items():
+        assert all({str(el) for el in e.composition.elements} == chemsys for e in entries)
+
+
 def test_get_stabilized_entry(gibbs_entries):
     entries = gibbs_entries.copy()
 
@@ -125,6 +162,7 @@ def test_get_adjusted_entry(interpolated_entry):
     entry_copy.energy_adjustments.append(ConstantEnergyAdjustment(0.1))
 
     assert entry_copy == GibbsEntrySet.get_adjusted_entry(interpolated_entry, ConstantEnergyAdjustment(0.1))
+    assert len(interpolated_entry.energy_adjustments) == len(entry_copy.energy_adjustments) - 1
 
 
 def test_from_pd(mp_entries):
@@ -132,6 +170,39 @@ def test_from_pd(mp_entries):
     assert entries is not None
 
 
+def test_from_pd_with_freed_data(entries):
+    pd = PhaseDiagram(list(entries))
+    nist_and_freed = GibbsEntrySet.from_pd(pd, temperature=1000, include_freed_data=True)
+
+    # ClO2 is tabulated in NIST but not in FREED; with FREED enabled it keeps a
+    # GibbsComputedEntry alongside its NIST entry
+    clo2_types = {e.__class__.__name__ for e in nist_and_freed if e.composition.reduced_formula == "ClO2"}
+    assert clo2_types == {"NISTReferenceEntry", "GibbsComputedEntry"}
+
+
+@pytest.mark.parametrize("with_entry_ids", [True, False])
+def test_from_computed_entries_parallel(with_entry_ids):
+    # a 10-element system, so that the entries are built from expanded phase diagrams
+    elemental_entries = [
+        ComputedStructureEntry(Structure(Lattice.cubic(3.0), [el], [[0, 0, 0]]), -5.0, entry_id=f"{el}-test")
+        for el in ["Ca", "Si"]
+    ]
+    computed_entries = (
+        loadfn(TEST_FILES_PATH / "Cl_Mn_Na_O_Y_entries.json.gz")
+        + loadfn(TEST_FILES_PATH / "Fe_Li_O_P_entries.json.gz")
+        + elemental_entries
+    )
+    if not with_entry_ids:
+        for e in computed_entries:
+            e.entry_id = None
+
+    serial = GibbsEntrySet.from_computed_entries(computed_entries, 1000)
+    parallel = GibbsEntrySet.from_computed_entries(computed_entries, 1000, parallel=True)
+
+    assert len(parallel) == len(serial)
+    assert set(parallel) == set(serial)
+
+
 def test_add(gibbs_entries):
     original_len = len(gibbs_entries)
 
@@ -1 +1,73 @@
 """Tests for BalancedPathway"""
+
+import pickle
+
+import numpy as np
+import pytest
+from rxn_network.core import Composition
+from rxn_network.pathways.balanced import BalancedPathway
+from rxn_network.reactions.basic import BasicReaction
+
+
+@pytest.fixture(scope="module")
+def pathway():
+    rxn1 = BasicReaction.balance([Composition("Y2O3"), Composition("Mn2O3")], [Composition("YMnO3")])
+    rxn2 = BasicReaction.balance([Composition("YMnO3"), Composition("Mn2O3")], [Composition("YMn3O6")])
+    return BalancedPathway([rxn1, rxn2], coefficients=[1.0, 1.0], costs=[0.1, 0.2], balanced=True)
+
+
+@pytest.fixture(scope="module")
+def net_rxn():
+    return BasicReaction.balance([Composition("Y2O3"), Composition("Mn2O3")], [Composition("YMn3O6")])
+
+
+def test_get_comp_matrix(pathway):
+    comp_matrix = pathway.get_comp_matrix()
+
+    assert comp_matrix.shape == (len(pathway.reactions), len(pathway.compositions))
+    for row, rxn in zip(comp_matrix, pathway.reactions):
+        for comp, idx in pathway._comp_index.items():
+            expected = rxn.get_coeff(comp) if comp in rxn.compositions else 0
+            assert row[idx] == pytest.approx(expected)
+
+    assert pathway.get_comp_matrix() is comp_matrix
+    assert not comp_matrix.flags.writeable
+
+
+def test_get_coeff_vector_for_rxn(pathway, net_rxn):
+    coeff_vector = pathway.get_coeff_vector_for_rxn(net_rxn)
+
+    comp_matrix = pathway.get_comp_matrix()
+    multiplicities = np.linalg.lstsq(comp_matrix.T, coeff_vector, rcond=None)[0]
+
+    assert np.allclose(comp_matrix.T @ multiplicities, coeff_vector)
+
+
+def test_contains_interdependent_rxns(pathway):
+    precursors = [Composition("Y2O3"), Composition("Mn2O3")]
+    assert not pathway.contains_interdependent_rxns(precursors)
+
+    rxn1 = BasicReaction.balance([Composition("Y2O3"), Composition("YMn3O6")], [Composition("YMnO3")])
+    rxn2 = BasicReaction.balance([Composition("YMnO3"), Composition("Mn2O3")], [Composition("YMn3O6")])
+    interdependent_pathway = BalancedPathway([rxn1, rxn2], coefficients=[1.0, 3.0], costs=[0.1, 0.2])
+
+    assert interdependent_pathway.contains_interdependent_rxns(precursors)
+
+
+def test_eq(pathway):
+    rxns = pathway.reactions
+
+    assert pathway == pathway
+    assert pathway == BalancedPathway(rxns, coefficients=[1.0, 1.0], costs=[0.1, 0.2 + 1e-9])
+    assert pathway != BalancedPathway(rxns, coefficients=[1.0, 1.0], costs=[0.1, 0.3])
+    assert pathway != BalancedPathway(rxns, coefficients=[1.0, 1.0], costs=[0.1])
+
+
+def test_pickle(pathway):
+    # the cached hash is not pickled, since it depends on the process's hash seed
+    assert "_hash" not in pathway.__getstate__()
+
+    unpickled = pickle.loads(pickle.dumps(pathway))
+    assert unpickled == pathway
+    assert hash(unpickled) == hash(pathway)
+    assert unpickled in {pathway}
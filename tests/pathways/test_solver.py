@@ -4,7 +4,7 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from rxn_network.pathways.solver import _balance_path_arrays_cpu
+from rxn_network.pathways.solver import _balance_comp_matrix, _balance_path_arrays_cpu, _fill_comp_matrices
 
 TEST_FILES_PATH = Path(__file__).parent.parent / "test_files"
 ARRAY_FILE = "comp_matrices.npy"
@@ -308,3 +308,35 @@ def test_balance_path_arrays_cpu(comp_matrices, net_coeffs, c_mats, m_mats):
     c_mats_actual, m_mats_actual = _balance_path_arrays_cpu(comp_matrices, net_coeffs, tol=1e-6)
     assert np.allclose(c_mats, c_mats_actual)
     assert np.allclose(m_mats, m_mats_actual)
+
+
+def test_balance_comp_matrix(net_coeffs, c_mats, m_mats):
+    for c_mat, m_mat in zip(c_mats, m_mats):
+        multiplicities, balanced = _balance_comp_matrix(c_mat, net_coeffs, tol=1e-6)
+        assert balanced
+        assert np.allclose(multiplicities, m_mat)
+
+    _, balanced = _balance_comp_matrix(c_mats[0][:2], net_coeffs, tol=1e-6)
+    assert not balanced
+
+
+def test_fill_comp_matrices():
+    # CSR arrays for three reactions over four entries
+    row_ptr = np.array([0, 2, 4, 7])
+    col_idx = np.array([0, 1, 1, 2, 0, 2, 3])
+    data = np.array([-1.0, 1.0, -1.0, 1.0, -2.0, -1.0, 1.0])
+    combos = np.array([[0, 1], [0, 2], [1, 2]])
+
+    comp_matrices = _fill_comp_matrices(combos, row_ptr, col_idx, data, 4, np.array([0, 2]))
+
+    expected = np.array(
+        [
+            [[-1.0, 1.0, 0.0, 0.0], [0.0, -1.0, 1.0, 0.0]],
+            [[-1.0, 1.0, 0.0, 0.0], [-2.0, 0.0, -1.0, 1.0]],
+            [[0.0, -1.0, 1.0, 0.0], [-2.0, 0.0, -1.0, 1.0]],
+        ]
+    )
+    assert np.array_equal(comp_matrices, expected)
+
+    comp_matrices = _fill_comp_matrices(combos, row_ptr, col_idx, data, 4, np.array([3]))
+    assert np.array_equal(comp_matrices, expected[1:])
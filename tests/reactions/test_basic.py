@@ -198,6 +198,15 @@ def test_get_coeff(pre_balanced_rxn):
     coeffs = [pre_balanced_rxn.get_coeff(c) for c in pre_balanced_rxn.compositions]
 
     assert coeffs == expected_coeffs
+    assert pre_balanced_rxn.get_coeff(Composition("FeO")) == 0
+
+
+def test_get_coeff_duplicate_composition():
+    mn2o3, o2, mno2 = Composition("Mn2O3"), Composition("O2"), Composition("MnO2")
+    rxn = BasicReaction.balance([mn2o3, o2], [mn2o3, mno2])
+
+    assert rxn.get_coeff(mn2o3) == pytest.approx(rxn.coefficients[0])
+    assert rxn.get_coeff(mn2o3) == pytest.approx(-1.5)
 
 
 def test_energy(pre_balanced_rxn):
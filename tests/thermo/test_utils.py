@@ -1,6 +1,8 @@
 """Tests for thermo/utils.py"""
 
-from rxn_network.thermo.utils import expand_pd
+import pytest
+from pymatgen.analysis.phase_diagram import PhaseDiagram
+from rxn_network.thermo.utils import CachedPhaseDiagram, expand_pd
 
 
 def test_expand_pd(entries):
@@ -20,3 +22,15 @@ def test_expand_pd(entries):
         "Cl-Mn-Na",
         "Na-O-Y",
     }
+
+
+def test_cached_phase_diagram(gibbs_entries):
+    pd = PhaseDiagram(gibbs_entries)
+    cached_pd = CachedPhaseDiagram(gibbs_entries)
+
+    for e in gibbs_entries:
+        comp = e.composition
+        assert cached_pd.get_hull_energy(comp) == pytest.approx(pd.get_hull_energy(comp))
+        assert cached_pd.get_hull_energy(comp * 2) == pytest.approx(2 * pd.get_hull_energy(comp))
+
+    assert len(cached_pd._hull_energy_cache) == len({e.composition.reduced_formula for e in gibbs_entries})